@@ -6,35 +6,51 @@
 
 import os
 import sys
+import shutil
+import functools
 import subprocess
 from pathlib import Path
 
+def _command_ok(args):
+    """命令存在且执行成功时返回True"""
+    if not shutil.which(args[0]):
+        return False
+    try:
+        return subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                              timeout=3).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+@functools.lru_cache(maxsize=1)
 def check_docker():
     """检查Docker是否可用"""
-    try:
-        result = subprocess.run(['docker', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Docker 可用")
-            return True
-        else:
-            print("❌ Docker 不可用")
-            return False
-    except FileNotFoundError:
+    if not shutil.which('docker'):
         print("❌ Docker 未安装")
         return False
+    if _command_ok(['docker', '--version']):
+        print("✅ Docker 可用")
+        return True
+    else:
+        print("❌ Docker 不可用")
+        return False
+
+@functools.lru_cache(maxsize=1)
+def compose_command():
+    """返回可用的Docker Compose命令，优先使用 docker compose 插件，都不可用时返回None"""
+    if _command_ok(['docker', 'compose', 'version']):
+        return "docker compose"
+    if _command_ok(['docker-compose', '--version']):
+        return "docker-compose"
+    return None
 
 def check_compose():
     """检查Docker Compose是否可用"""
-    try:
-        result = subprocess.run(['docker-compose', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Docker Compose 可用")
-            return True
-        else:
-            print("❌ Docker Compose 不可用")
-            return False
-    except FileNotFoundError:
-        print("❌ Docker Compose 未安装")
+    command = compose_command()
+    if command:
+        print(f"✅ Docker Compose 可用 ({command})")
+        return True
+    else:
+        print("❌ Docker Compose 不可用")
         return False
 
 def check_env_file():
@@ -65,9 +81,18 @@ def check_project_structure():
         'scripts/setup-database.py'
     ]
     
+    # 每个父目录只扫描一次，用集合判断文件是否存在
+    listings = {}
     missing_files = []
     for file_path in required_files:
-        if not Path(file_path).exists():
+        path = Path(file_path)
+        if path.parent not in listings:
+            try:
+                with os.scandir(path.parent) as entries:
+                    listings[path.parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[path.parent] = set()
+        if path.name not in listings[path.parent]:
             missing_files.append(file_path)
     
     if missing_files:
@@ -111,7 +136,7 @@ def main():
         print("\n下一步:")
         print("1. 编辑 .env 文件，配置AI API密钥")
         print("2. 运行 python scripts/setup-database.py 初始化数据库")
-        print("3. 运行 docker-compose up -d 启动服务")
+        print(f"3. 运行 {compose_command()} up -d 启动服务")
         print("4. 访问 http://localhost:3002 开始使用")
         return 0
     else:
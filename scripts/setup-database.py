@@ -7,13 +7,234 @@ import os
 import sys
 import sqlite3
 import json
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# 连接打开后执行的PRAGMA设置
+SQLITE_PRAGMAS = """
+    PRAGMA foreign_keys=ON;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+"""
+
+# 初始化脚本使用的bcrypt轮数，开发环境默认取最小值4，生产环境可设为12
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS_INIT', '4'))
+# 低轮数只适用于随机生成的高熵密码；通过INIT_ADMIN_PASSWORD指定的密码至少使用该轮数
+USER_PASSWORD_BCRYPT_ROUNDS = 12
+
+# 设置INIT_SKIP_ADMIN=1时不创建默认管理员账户（CI/测试环境）
+SKIP_ADMIN = os.getenv('INIT_SKIP_ADMIN') == '1'
+
+# Redis连接池大小，以及初始化时预先建立的连接数
+REDIS_MAX_CONNECTIONS = 16
+REDIS_POOL_MIN_IDLE = int(os.getenv('REDIS_POOL_MIN_IDLE', '2'))
+
+# 建表语句，整体作为一个事务执行。
+# 行较小的TEXT主键表使用WITHOUT ROWID，数据直接存放在主键B树中；
+# 章节、角色、记忆、质量报告的行包含大段文本，保留默认rowid布局
+SQLITE_SCHEMA = """
+    BEGIN;
+
+    -- 用户表
+    CREATE TABLE IF NOT EXISTS users (
+        user_id TEXT PRIMARY KEY,
+        username TEXT UNIQUE NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        role TEXT NOT NULL DEFAULT 'user',
+        created_at TEXT NOT NULL,
+        last_login TEXT,
+        is_active BOOLEAN DEFAULT 1,
+        api_key TEXT,
+        settings TEXT
+    ) WITHOUT ROWID;
+
+    -- 项目表
+    CREATE TABLE IF NOT EXISTS projects (
+        project_id TEXT PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        genre TEXT NOT NULL,
+        length TEXT NOT NULL,
+        theme TEXT NOT NULL,
+        target_audience TEXT NOT NULL,
+        language TEXT DEFAULT '中文',
+        status TEXT DEFAULT 'draft',
+        progress REAL DEFAULT 0.0,
+        word_count INTEGER DEFAULT 0,
+        target_words INTEGER DEFAULT 0,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        FOREIGN KEY (user_id) REFERENCES users (user_id)
+    ) WITHOUT ROWID;
+
+    -- 章节表
+    CREATE TABLE IF NOT EXISTS chapters (
+        chapter_id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        chapter_number INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        content TEXT,
+        word_count INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'draft',
+        quality_score REAL DEFAULT 0.0,
+        ai_agent TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        FOREIGN KEY (project_id) REFERENCES projects (project_id)
+    );
+
+    -- 角色档案表
+    CREATE TABLE IF NOT EXISTS characters (
+        character_id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        role TEXT NOT NULL,
+        description TEXT,
+        personality TEXT,
+        relationships TEXT,
+        backstory TEXT,
+        goals TEXT,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (project_id) REFERENCES projects (project_id)
+    );
+
+    -- 记忆表
+    CREATE TABLE IF NOT EXISTS memories (
+        memory_id TEXT PRIMARY KEY,
+        project_id TEXT,
+        category TEXT NOT NULL,
+        memory_type TEXT NOT NULL,
+        content TEXT NOT NULL,
+        importance_score REAL DEFAULT 0.5,
+        metadata TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        FOREIGN KEY (project_id) REFERENCES projects (project_id)
+    );
+
+    -- 质量评估表
+    CREATE TABLE IF NOT EXISTS quality_reports (
+        report_id TEXT PRIMARY KEY,
+        project_id TEXT,
+        chapter_id TEXT,
+        overall_score REAL NOT NULL,
+        readability_score REAL,
+        coherence_score REAL,
+        creativity_score REAL,
+        grammar_score REAL,
+        consistency_score REAL,
+        engagement_score REAL,
+        feedback TEXT,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (project_id) REFERENCES projects (project_id),
+        FOREIGN KEY (chapter_id) REFERENCES chapters (chapter_id)
+    );
+
+    -- AI代理状态表
+    CREATE TABLE IF NOT EXISTS agent_status (
+        agent_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL,
+        status TEXT DEFAULT 'idle',
+        current_task TEXT,
+        model TEXT NOT NULL,
+        specialty TEXT,
+        performance TEXT,
+        last_active TEXT,
+        uptime TEXT,
+        memory_usage REAL,
+        cpu_usage REAL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    ) WITHOUT ROWID;
+
+    -- 项目设置表
+    CREATE TABLE IF NOT EXISTS project_settings (
+        setting_id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        setting_key TEXT NOT NULL,
+        setting_value TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        FOREIGN KEY (project_id) REFERENCES projects (project_id)
+    ) WITHOUT ROWID;
+
+    COMMIT;
+"""
+
+# 索引定义：索引名 -> 建索引语句
+# 每个外键列都有以其开头的索引，开启foreign_keys后外键检查不会扫描全表
+SQLITE_INDEXES = {
+    "idx_users_username": "CREATE INDEX IF NOT EXISTS idx_users_username ON users (username)",
+    "idx_projects_user": "CREATE INDEX IF NOT EXISTS idx_projects_user ON projects (user_id)",
+    "idx_projects_status": "CREATE INDEX IF NOT EXISTS idx_projects_status ON projects (status)",
+    "idx_chapters_project_number": "CREATE INDEX IF NOT EXISTS idx_chapters_project_number ON chapters (project_id, chapter_number)",
+    "idx_characters_project": "CREATE INDEX IF NOT EXISTS idx_characters_project ON characters (project_id)",
+    "idx_memories_project": "CREATE INDEX IF NOT EXISTS idx_memories_project ON memories (project_id)",
+    "idx_memories_category": "CREATE INDEX IF NOT EXISTS idx_memories_category ON memories (category)",
+    "idx_quality_project": "CREATE INDEX IF NOT EXISTS idx_quality_project ON quality_reports (project_id)",
+    "idx_quality_chapter": "CREATE INDEX IF NOT EXISTS idx_quality_chapter ON quality_reports (chapter_id)",
+    "idx_settings_project": "CREATE INDEX IF NOT EXISTS idx_settings_project ON project_settings (project_id)"
+}
+
+# 内容表索引：大批量导入章节、角色、记忆时可先删除，导入后重建
+CONTENT_INDEXES = (
+    "idx_chapters_project_number",
+    "idx_characters_project",
+    "idx_memories_project",
+    "idx_memories_category"
+)
+
+# 已被组合索引idx_chapters_project_number取代的旧索引，建索引时一并删除
+OBSOLETE_INDEXES = (
+    "idx_chapters_project",
+    "idx_chapters_number"
+)
+
+# 示例项目数据，字段顺序: project_id, title, description, genre, length, theme,
+# target_audience, status, progress, word_count, target_words
+# (user_id和时间戳在插入时补上)
+_SAMPLE_PROJECT_ROWS: Tuple[Tuple, ...] = (
+    ('project_001', '星际征途', '探索未知星系的科幻冒险小说', 'science_fiction', 'medium',
+     '探索与成长', '青年读者', 'active', 0.0, 0, 30000),
+    ('project_002', '古风情缘', '古代背景的浪漫爱情故事', 'romance', 'short',
+     '爱情与忠诚', '女性读者', 'draft', 0.0, 0, 15000)
+)
+
+
+# 建表、Redis、ChromaDB初始化会并行执行，输出时加锁避免同一行被打断
+_print_lock = threading.Lock()
+
+
+def _log(message):
+    """线程安全地输出一行信息"""
+    with _print_lock:
+        print(message)
+
+
+def _hash_password(password, rounds=BCRYPT_ROUNDS):
+    """计算bcrypt密码哈希，bcrypt在计算期间会释放GIL，可放到后台线程执行"""
+    # 导入密码哈希函数
+    import bcrypt
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _ddl_script(statements):
+    """把多条DDL语句拼接成一个事务脚本，交给executescript一次执行"""
+    return "BEGIN;\n" + ";\n".join(statements) + ";\nCOMMIT;"
+
+
 class DatabaseInitializer:
     """数据库初始化器"""
     
@@ -23,224 +244,130 @@ class DatabaseInitializer:
         self.chroma_dir = self.data_dir / "chroma"
         self.exports_dir = self.data_dir / "exports"
         
-        # 创建数据目录
-        self.data_dir.mkdir(exist_ok=True)
-        self.db_dir.mkdir(exist_ok=True)
-        self.chroma_dir.mkdir(exist_ok=True)
-        self.exports_dir.mkdir(exist_ok=True)
+        # 创建数据目录，parents=True会顺带创建data_dir
+        for directory in [self.db_dir, self.chroma_dir, self.exports_dir]:
+            directory.mkdir(parents=True, exist_ok=True)
         
         self.sqlite_path = self.db_dir / "goodtxt.db"
+        # 共享的SQLite连接，由_get_conn()延迟打开，close()统一关闭
+        self.conn = None
+        # Redis连接池，初始化成功后供后续代码复用
+        self.redis_pool = None
+        # 本次初始化写入数据统一使用的时间戳
+        self.timestamp = datetime.now().isoformat()
+        # 管理员初始密码，可通过INIT_ADMIN_PASSWORD指定，否则随机生成并只输出一次
+        # 指定的密码熵未知，哈希时使用完整的bcrypt轮数
+        given_password = os.getenv('INIT_ADMIN_PASSWORD')
+        if given_password:
+            self.admin_password = given_password
+            self.admin_rounds = max(BCRYPT_ROUNDS, USER_PASSWORD_BCRYPT_ROUNDS)
+        else:
+            self.admin_password = secrets.token_urlsafe(16)
+            self.admin_rounds = BCRYPT_ROUNDS
+        # run()中提前在后台计算的管理员密码哈希
+        self._admin_hash = None
         
-    def create_sqlite_tables(self):
-        """创建SQLite数据库表"""
-        print("📦 创建SQLite数据库表...")
-        
-        conn = sqlite3.connect(str(self.sqlite_path))
-        cursor = conn.cursor()
-        
-        # 用户表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                user_id TEXT PRIMARY KEY,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL DEFAULT 'user',
-                created_at TEXT NOT NULL,
-                last_login TEXT,
-                is_active BOOLEAN DEFAULT 1,
-                api_key TEXT,
-                settings TEXT
-            )
-        ''')
-        
-        # 项目表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS projects (
-                project_id TEXT PRIMARY KEY,
-                user_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                genre TEXT NOT NULL,
-                length TEXT NOT NULL,
-                theme TEXT NOT NULL,
-                target_audience TEXT NOT NULL,
-                language TEXT DEFAULT '中文',
-                status TEXT DEFAULT 'draft',
-                progress REAL DEFAULT 0.0,
-                word_count INTEGER DEFAULT 0,
-                target_words INTEGER DEFAULT 0,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY (user_id) REFERENCES users (user_id)
-            )
-        ''')
-        
-        # 章节表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS chapters (
-                chapter_id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                chapter_number INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT,
-                word_count INTEGER DEFAULT 0,
-                status TEXT DEFAULT 'draft',
-                quality_score REAL DEFAULT 0.0,
-                ai_agent TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects (project_id)
-            )
-        ''')
-        
-        # 角色档案表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS characters (
-                character_id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                role TEXT NOT NULL,
-                description TEXT,
-                personality TEXT,
-                relationships TEXT,
-                backstory TEXT,
-                goals TEXT,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects (project_id)
-            )
-        ''')
-        
-        # 记忆表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS memories (
-                memory_id TEXT PRIMARY KEY,
-                project_id TEXT,
-                category TEXT NOT NULL,
-                memory_type TEXT NOT NULL,
-                content TEXT NOT NULL,
-                importance_score REAL DEFAULT 0.5,
-                metadata TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects (project_id)
-            )
-        ''')
-        
-        # 质量评估表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quality_reports (
-                report_id TEXT PRIMARY KEY,
-                project_id TEXT,
-                chapter_id TEXT,
-                overall_score REAL NOT NULL,
-                readability_score REAL,
-                coherence_score REAL,
-                creativity_score REAL,
-                grammar_score REAL,
-                consistency_score REAL,
-                engagement_score REAL,
-                feedback TEXT,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects (project_id),
-                FOREIGN KEY (chapter_id) REFERENCES chapters (chapter_id)
-            )
-        ''')
-        
-        # AI代理状态表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS agent_status (
-                agent_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                type TEXT NOT NULL,
-                status TEXT DEFAULT 'idle',
-                current_task TEXT,
-                model TEXT NOT NULL,
-                specialty TEXT,
-                performance TEXT,
-                last_active TEXT,
-                uptime TEXT,
-                memory_usage REAL,
-                cpu_usage REAL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        ''')
-        
-        # 项目设置表
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS project_settings (
-                setting_id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                setting_key TEXT NOT NULL,
-                setting_value TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects (project_id)
-            )
-        ''')
+    def _get_conn(self):
+        """获取共享的SQLite连接，首次调用时打开并应用PRAGMA设置"""
+        if self.conn is None:
+            self.conn = sqlite3.connect(str(self.sqlite_path))
+            # WAL + synchronous=NORMAL，减少初始化过程中的fsync次数
+            self.conn.executescript(SQLITE_PRAGMAS)
+        return self.conn
+    
+    def close(self):
+        """提交未完成的写入并关闭共享连接"""
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+    
+    def create_sqlite_schema(self):
+        """创建SQLite数据库表（不含索引，索引在数据写入后创建）"""
+        _log("📦 创建SQLite数据库表...")
         
-        # 创建索引
-        indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_users_username ON users (username)",
-            "CREATE INDEX IF NOT EXISTS idx_projects_user ON projects (user_id)",
-            "CREATE INDEX IF NOT EXISTS idx_projects_status ON projects (status)",
-            "CREATE INDEX IF NOT EXISTS idx_chapters_project ON chapters (project_id)",
-            "CREATE INDEX IF NOT EXISTS idx_chapters_number ON chapters (chapter_number)",
-            "CREATE INDEX IF NOT EXISTS idx_characters_project ON characters (project_id)",
-            "CREATE INDEX IF NOT EXISTS idx_memories_project ON memories (project_id)",
-            "CREATE INDEX IF NOT EXISTS idx_memories_category ON memories (category)",
-            "CREATE INDEX IF NOT EXISTS idx_quality_project ON quality_reports (project_id)",
-            "CREATE INDEX IF NOT EXISTS idx_quality_chapter ON quality_reports (chapter_id)"
-        ]
+        # 所有建表语句放在同一个事务中，一次性提交
+        self._get_conn().executescript(SQLITE_SCHEMA)
+        _log("✅ SQLite数据库表创建完成")
+    
+    def create_sqlite_indexes(self, names=None):
+        """创建索引，names为空时创建全部索引"""
+        print("📇 创建SQLite索引...")
         
-        for index_sql in indexes:
-            cursor.execute(index_sql)
+        statements = [SQLITE_INDEXES[name] for name in names or SQLITE_INDEXES]
+        if names is None:
+            # 旧版本数据库可能还留有被取代的索引
+            statements = [f"DROP INDEX IF EXISTS {name}" for name in OBSOLETE_INDEXES] + statements
         
-        conn.commit()
-        conn.close()
-        print("✅ SQLite数据库表创建完成")
+        self._get_conn().executescript(_ddl_script(statements))
+        print("✅ SQLite索引创建完成")
+    
+    def drop_content_indexes(self):
+        """删除内容表索引，大批量导入章节/记忆等数据前调用，导入后再重建"""
+        self._get_conn().executescript(
+            _ddl_script(f"DROP INDEX IF EXISTS {name}" for name in CONTENT_INDEXES)
+        )
+    
+    def rebuild_content_indexes(self):
+        """重建drop_content_indexes删除的内容表索引"""
+        self.create_sqlite_indexes(CONTENT_INDEXES)
         
     def initialize_redis_data(self):
         """初始化Redis数据"""
-        print("🔴 初始化Redis数据...")
+        _log("🔴 初始化Redis数据...")
         try:
             import redis
-            
+        except ImportError:
+            _log("⚠️  Redis模块未安装，跳过Redis初始化")
+            return
+        
+        try:
             # 连接Redis (使用环境变量或默认配置)
             redis_host = os.getenv('REDIS_HOST', 'redis')
             redis_port = int(os.getenv('REDIS_PORT', '6379'))
-            r = redis.Redis(host=redis_host, port=redis_port, db=0, decode_responses=True)
+            pool = redis.ConnectionPool(
+                host=redis_host, port=redis_port, db=0,
+                max_connections=REDIS_MAX_CONNECTIONS, decode_responses=True
+            )
+            
+            # 预先建立连接再放回连接池，首个命令不再承担建连耗时
+            warm = [pool.get_connection('PING') for _ in range(REDIS_POOL_MIN_IDLE)]
+            for connection in warm:
+                pool.release(connection)
+            
+            r = redis.Redis(connection_pool=pool)
             
             # 测试连接
             r.ping()
             
-            # 设置默认配置
-            r.hset('config:default', mapping={
-                'max_concurrent_projects': '5',
-                'default_chapter_length': '2000',
-                'auto_save_interval': '30',
-                'quality_threshold': '0.8'
-            })
+            # 两条写入合并到一个pipeline，只需一次网络往返
+            with r.pipeline(transaction=False) as pipe:
+                # 设置默认配置
+                pipe.hset('config:default', mapping={
+                    'max_concurrent_projects': '5',
+                    'default_chapter_length': '2000',
+                    'auto_save_interval': '30',
+                    'quality_threshold': '0.8'
+                })
+                
+                # 初始化用户会话模板
+                pipe.setex('session:template', 3600, json.dumps({
+                    'theme': 'light',
+                    'language': 'zh-CN',
+                    'notifications': True,
+                    'auto_refresh': True
+                }))
+                pipe.execute()
             
-            # 初始化用户会话模板
-            r.setex('session:template', 3600, json.dumps({
-                'theme': 'light',
-                'language': 'zh-CN',
-                'notifications': True,
-                'auto_refresh': True
-            }))
-            
-            print("✅ Redis数据初始化完成")
+            self.redis_pool = pool
+            _log("✅ Redis数据初始化完成")
             
         except redis.ConnectionError:
-            print("⚠️  Redis未启动，跳过Redis初始化")
-        except ImportError:
-            print("⚠️  Redis模块未安装，跳过Redis初始化")
+            _log("⚠️  Redis未启动，跳过Redis初始化")
     
     def initialize_chroma_db(self):
         """初始化ChromaDB向量数据库"""
-        print("🧠 初始化ChromaDB向量数据库...")
+        _log("🧠 初始化ChromaDB向量数据库...")
         try:
             import chromadb
             from chromadb.config import Settings
@@ -262,47 +389,53 @@ class DatabaseInitializer:
                 'plot_outlines': '情节大纲向量存储'
             }
             
+            # 一次取出已有集合，按名称比对，不再逐个get_collection试探
+            # (新版chromadb的list_collections直接返回名称)
+            existing = {getattr(c, 'name', c) for c in client.list_collections()}
+            
             for collection_name, description in collections.items():
-                try:
-                    collection = client.get_collection(collection_name)
-                    print(f"✅ 集合 {collection_name} 已存在")
-                except:
-                    collection = client.create_collection(
+                if collection_name in existing:
+                    _log(f"✅ 集合 {collection_name} 已存在")
+                else:
+                    client.create_collection(
                         name=collection_name,
                         metadata={"description": description}
                     )
-                    print(f"✅ 创建集合 {collection_name}")
+                    _log(f"✅ 创建集合 {collection_name}")
             
-            print("✅ ChromaDB初始化完成")
+            _log("✅ ChromaDB初始化完成")
             
         except ImportError:
-            print("⚠️  ChromaDB未安装，跳过向量数据库初始化")
+            _log("⚠️  ChromaDB未安装，跳过向量数据库初始化")
         except Exception as e:
-            print(f"⚠️  ChromaDB初始化失败: {e}")
+            _log(f"⚠️  ChromaDB初始化失败: {e}")
     
     def create_default_admin(self):
         """创建默认管理员账户"""
+        if SKIP_ADMIN:
+            print("⏭️  已设置INIT_SKIP_ADMIN，跳过管理员账户创建")
+            return
+        
         print("👤 创建默认管理员账户...")
         
-        conn = sqlite3.connect(str(self.sqlite_path))
-        cursor = conn.cursor()
+        cursor = self._get_conn().cursor()
         
         # 检查是否已有管理员
         cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'admin'")
         admin_count = cursor.fetchone()[0]
         
         if admin_count == 0:
-            # 导入密码哈希函数
-            import bcrypt
-            
             # 创建管理员账户
             admin_id = "admin_001"
             username = "admin"
             email = "admin@goodtxt.com"
-            password = "admin123456"
-            password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-            api_key = f"gk_{os.urandom(16).hex()}"
-            created_at = datetime.now().isoformat()
+            password = self.admin_password
+            if self._admin_hash is not None:
+                password_hash = self._admin_hash.result()
+            else:
+                password_hash = _hash_password(password, self.admin_rounds)
+            api_key = f"gk_{secrets.token_hex(16)}"
+            created_at = self.timestamp
             
             cursor.execute('''
                 INSERT INTO users (
@@ -314,23 +447,20 @@ class DatabaseInitializer:
                 json.dumps({"theme": "light", "language": "zh-CN"})
             ))
             
-            conn.commit()
             print(f"✅ 创建默认管理员账户:")
             print(f"   用户名: {username}")
             print(f"   密码: {password}")
             print(f"   邮箱: {email}")
+            print("⚠️  密码只显示这一次，请妥善保存并在首次登录后修改")
             
         else:
             print("✅ 管理员账户已存在")
-        
-        conn.close()
     
     def create_sample_data(self):
         """创建示例数据"""
         print("📝 创建示例数据...")
         
-        conn = sqlite3.connect(str(self.sqlite_path))
-        cursor = conn.cursor()
+        cursor = self._get_conn().cursor()
         
         # 创建示例用户
         cursor.execute("SELECT user_id FROM users WHERE username = 'admin'")
@@ -339,59 +469,22 @@ class DatabaseInitializer:
             admin_id = admin_result[0]
             
             # 创建示例项目
-            sample_projects = [
-                {
-                    'project_id': 'project_001',
-                    'user_id': admin_id,
-                    'title': '星际征途',
-                    'description': '探索未知星系的科幻冒险小说',
-                    'genre': 'science_fiction',
-                    'length': 'medium',
-                    'theme': '探索与成长',
-                    'target_audience': '青年读者',
-                    'status': 'active',
-                    'progress': 0.0,
-                    'word_count': 0,
-                    'target_words': 30000
-                },
-                {
-                    'project_id': 'project_002',
-                    'user_id': admin_id,
-                    'title': '古风情缘',
-                    'description': '古代背景的浪漫爱情故事',
-                    'genre': 'romance',
-                    'length': 'short',
-                    'theme': '爱情与忠诚',
-                    'target_audience': '女性读者',
-                    'status': 'draft',
-                    'progress': 0.0,
-                    'word_count': 0,
-                    'target_words': 15000
-                }
-            ]
-            
-            for project in sample_projects:
-                try:
-                    cursor.execute('''
-                        INSERT INTO projects (
-                            project_id, user_id, title, description, genre, length,
-                            theme, target_audience, status, progress, word_count, 
-                            target_words, created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        project['project_id'], project['user_id'], project['title'],
-                        project['description'], project['genre'], project['length'],
-                        project['theme'], project['target_audience'], project['status'],
-                        project['progress'], project['word_count'], project['target_words'],
-                        datetime.now().isoformat(), datetime.now().isoformat()
-                    ))
-                    print(f"✅ 创建示例项目: {project['title']}")
-                except sqlite3.IntegrityError:
-                    print(f"⚠️  项目已存在: {project['title']}")
+            now = self.timestamp
+            rows = [(admin_id, *row, now, now) for row in _SAMPLE_PROJECT_ROWS]
             
-            conn.commit()
+            # 批量插入，已存在的项目直接跳过
+            cursor.executemany('''
+                INSERT OR IGNORE INTO projects (
+                    user_id, project_id, title, description, genre, length,
+                    theme, target_audience, status, progress, word_count, 
+                    target_words, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            created = cursor.rowcount
+            print(f"✅ 创建示例项目: {created} 个")
+            if created < len(rows):
+                print(f"⚠️  已存在项目: {len(rows) - created} 个")
         
-        conn.close()
         print("✅ 示例数据创建完成")
     
     def setup_directory_permissions(self):
@@ -412,12 +505,18 @@ class DatabaseInitializer:
         
         # 检查SQLite
         if self.sqlite_path.exists():
-            conn = sqlite3.connect(str(self.sqlite_path))
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
+            cursor = self._get_conn().cursor()
+            if sqlite3.sqlite_version_info >= (3, 37, 0):
+                # PRAGMA table_list直接读取已加载的schema缓存
+                cursor.execute("PRAGMA table_list")
+                tables = [
+                    row[1] for row in cursor.fetchall()
+                    if row[0] == 'main' and row[2] == 'table' and not row[1].startswith('sqlite_')
+                ]
+            else:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                tables = cursor.fetchall()
             print(f"✅ SQLite: {len(tables)} 个表")
-            conn.close()
         else:
             print("❌ SQLite数据库未创建")
         
@@ -442,11 +541,34 @@ class DatabaseInitializer:
         
         try:
             self.setup_directory_permissions()
-            self.create_sqlite_tables()
-            self.initialize_redis_data()
-            self.initialize_chroma_db()
-            self.create_default_admin()
-            self.create_sample_data()
+            
+            # Redis和ChromaDB与SQLite互不依赖，放到后台线程与建表并行执行；
+            # 建表留在主线程，保证共享的SQLite连接只在主线程使用。
+            # 管理员密码哈希同样提前在后台计算，创建账户时直接取结果
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                if not SKIP_ADMIN:
+                    self._admin_hash = executor.submit(_hash_password, self.admin_password, self.admin_rounds)
+                futures = [
+                    executor.submit(self.initialize_redis_data),
+                    executor.submit(self.initialize_chroma_db)
+                ]
+                self.create_sqlite_schema()
+                for future in as_completed(futures):
+                    future.result()
+            
+            try:
+                self.create_default_admin()
+                self.create_sample_data()
+                # 管理员和示例数据在同一个事务中提交
+                self.conn.commit()
+            except Exception:
+                # 写入失败时回滚未提交的数据
+                self.conn.rollback()
+                raise
+            finally:
+                # 数据写入完成后再建索引，避免插入时维护索引；
+                # 写入失败时同样要建好索引，不留下没有索引的库
+                self.create_sqlite_indexes()
             self.verify_installation()
             
             print("=" * 50)
@@ -455,11 +577,13 @@ class DatabaseInitializer:
             print("1. 配置AI API密钥 (.env文件)")
             print("2. 启动系统: python main.py")
             print("3. 访问前端: http://localhost:3002")
-            print("4. 登录: admin / admin123456")
+            print("4. 登录: admin / 上方输出的初始密码")
             
         except Exception as e:
             print(f"❌ 初始化失败: {e}")
             raise
+        finally:
+            self.close()
 
 if __name__ == "__main__":
     initializer = DatabaseInitializer()
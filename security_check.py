@@ -6,19 +6,38 @@ GoodTxt 项目安全检查脚本
 
 import os
 import sys
+import io
+import mmap
+from contextlib import redirect_stdout
 from pathlib import Path
-import re
+
+# 各项检查查找的标记（UTF-8字节）
+JWT_LENGTH_CHECK = b"len(self.jwt_secret) < 32"
+ADMIN_REMOVED_NOTE = b"# Note: Production environments should not auto-create default admin accounts"
+ADMIN_CREATE_COMMENT = "# 创建默认管理员用户".encode("utf-8")
+ENV_SECRET_HINT = b"PLEASE_CHANGE_THIS_TO_A_LONG_RANDOM_STRING"
+README_SECURITY_NOTES = "安全注意事项".encode("utf-8")
+README_JWT_NOTES = "更改JWT密钥".encode("utf-8")
+
+def _find_markers(path, *markers):
+    """只映射一次文件，查找全部标记，不解码整个文件；返回每个标记是否存在，文件不存在时返回None"""
+    file_path = Path(path)
+    if not file_path.exists():
+        return None
+    # 空文件无法mmap
+    if file_path.stat().st_size == 0:
+        return tuple(False for _ in markers)
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return tuple(mm.find(marker) != -1 for marker in markers)
 
 def check_jwt_secret_security():
     """检查JWT密钥安全性"""
     print("🔍 检查JWT密钥安全性...")
     
-    settings_file = Path("backend/src/config/settings.py")
-    if settings_file.exists():
-        content = settings_file.read_text()
-        
+    found = _find_markers("backend/src/config/settings.py", JWT_LENGTH_CHECK)
+    if found is not None:
         # 检查是否增加了长度验证
-        if "len(self.jwt_secret) < 32" in content:
+        if found[0]:
             print("✅ 已添加JWT密钥长度验证")
         else:
             print("❌ 未找到JWT密钥长度验证")
@@ -32,13 +51,11 @@ def check_default_admin_removal():
     """检查默认管理员账户移除"""
     print("\n🔍 检查默认管理员账户...")
     
-    auth_file = Path("backend/src/auth/auth_manager.py")
-    if auth_file.exists():
-        content = auth_file.read_text()
-        
+    found = _find_markers("backend/src/auth/auth_manager.py", ADMIN_REMOVED_NOTE, ADMIN_CREATE_COMMENT)
+    if found is not None:
+        has_note, has_create = found
         # 检查是否注释了默认管理员创建
-        if "# Note: Production environments should not auto-create default admin accounts" in content or \
-           "# 创建默认管理员用户" not in content:
+        if has_note or not has_create:
             print("✅ 已移除/注释默认管理员账户创建")
         else:
             print("❌ 仍存在默认管理员账户创建代码")
@@ -72,12 +89,10 @@ def check_secure_env_file():
     """检查安全的环境配置"""
     print("\n🔍 检查环境配置安全性...")
     
-    env_file = Path(".env")
-    if env_file.exists():
-        content = env_file.read_text()
-        
+    found = _find_markers(".env", ENV_SECRET_HINT)
+    if found is not None:
         # 检查是否提供了安全的默认密钥
-        if "PLEASE_CHANGE_THIS_TO_A_LONG_RANDOM_STRING" in content:
+        if found[0]:
             print("✅ 环境文件包含安全提示")
         else:
             print("❌ 环境文件未包含安全提示")
@@ -91,11 +106,9 @@ def check_readme_updates():
     """检查README更新"""
     print("\n🔍 检查README安全说明...")
     
-    readme_file = Path("README.md")
-    if readme_file.exists():
-        content = readme_file.read_text()
-        
-        if "安全注意事项" in content and "更改JWT密钥" in content:
+    found = _find_markers("README.md", README_SECURITY_NOTES, README_JWT_NOTES)
+    if found is not None:
+        if all(found):
             print("✅ README已更新安全说明")
         else:
             print("❌ README未更新安全说明")
@@ -146,4 +159,11 @@ def main():
 if __name__ == "__main__":
     # 切换到项目根目录
     os.chdir(Path(__file__).parent)
-    main()
\ No newline at end of file
+    
+    # 检查输出先写入缓冲区，结束后一次性写出
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
\ No newline at end of file
@@ -8,18 +8,23 @@ import os
 import sys
 import time
 import json
-import requests
 import subprocess
-import platform
 import socket
 import shutil
-import sqlite3
 import urllib.request
+import http.client
 import urllib.parse
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime
-import hashlib
+import threading
+import select
+import atexit
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+import re
+import ipaddress
 
 # 尝试导入psutil，如果失败则设为None
 try:
@@ -45,11 +50,156 @@ class Color:
     UNDERLINE = '\033[4m'
 
 
+# IPv4地址格式（匹配响应原始字节）
+_IPV4_RE = re.compile(rb"^(?:\d{1,3}\.){3}\d{1,3}$")
+
+# 单个健康检查请求的 (连接超时, 读取超时)，死掉的服务能快速失败
+HEALTH_TIMEOUT = (
+    float(os.getenv('HEALTH_CONNECT_TIMEOUT', '2')),
+    float(os.getenv('HEALTH_READ_TIMEOUT', '3'))
+)
+
+# 单轮服务健康检查的总时间预算（秒）
+HEALTH_CHECK_BUDGET = 15
+
+# 环境检测结果（IP信息）缓存时间（秒）
+ENV_CACHE_TTL = 300
+
+# 容器状态缓存时间（秒），监控模式下容器状态变化较慢，使用更长的缓存时间
+CONTAINER_CACHE_TTL = 3
+MONITOR_CONTAINER_TTL = 30
+
+# 服务状态对应的图标和颜色
+_STATUS_EMOJI = {
+    "healthy": "✅",
+    "unhealthy": "❌",
+    "timeout": "⏰",
+    "connection_error": "🔌",
+    "error": "💥",
+    "unknown": "❓"
+}
+_STATUS_COLOR = {
+    "healthy": "\033[92m",
+    "unhealthy": "\033[91m",
+    "timeout": "\033[93m",
+    "connection_error": "\033[91m",
+    "error": "\033[91m",
+    "unknown": "\033[90m"
+}
+
+# 光标归位并清屏的ANSI转义序列
+_CLEAR = "\x1b[H\x1b[2J"
+
+
+def _enable_vt_mode() -> bool:
+    """Windows 10+控制台启用ANSI转义序列处理，非Windows系统直接返回True"""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+ANSI_ENABLED = _enable_vt_mode()
+
+# 子进程环境：禁用apt交互提示并跳过本地化初始化
+COMMAND_ENV = {**os.environ, "DEBIAN_FRONTEND": "noninteractive", "LC_ALL": "C"}
+
+
 class SuperLauncher:
     """超级启动器 - 整合所有功能的智能系统"""
     
-    def __init__(self):
+    # 状态输出模板，类加载时构建一次
+    _STATUS = {
+        "success": f"  {Color.GREEN}✅ {{}}{Color.RESET}",
+        "warning": f"  {Color.YELLOW}⚠️  {{}}{Color.RESET}",
+        "error": f"  {Color.RED}❌ {{}}{Color.RESET}",
+        "info": f"  {Color.CYAN}ℹ️  {{}}{Color.RESET}",
+        "fix": f"  {Color.PURPLE}🔧 {{}}{Color.RESET}",
+        "install": f"  {Color.BLUE}📦 {{}}{Color.RESET}"
+    }
+    
+    # 横幅、标题及部署总结中的固定文本
+    _RULE = "=" * 80
+    _BANNER = (
+        f"{Color.BOLD}{Color.CYAN}\n"
+        "╔══════════════════════════════════════════════════════════════╗\n"
+        "║              🚀 GoodTxt 超级启动器 v2.0 🚀                  ║\n"
+        "║          多AI协同小说生成系统智能管理                   ║\n"
+        "║                    一站式解决方案                         ║\n"
+        "╚══════════════════════════════════════════════════════════════╝\n"
+        f"{Color.RESET}\n"
+    )
+    _HEADER = (
+        f"{Color.BOLD}{Color.CYAN}\n"
+        f"{_RULE}\n"
+        "🚀 GoodTxt 多AI协同小说生成系统 - 智能管理系统\n"
+        f"{_RULE}\n"
+        f"{Color.RESET}\n"
+    )
+    _SUMMARY_HEAD = (
+        f"\n{Color.BOLD}{Color.GREEN}🎉 部署成功！{Color.RESET}\n"
+        f"{'=' * 50}\n"
+    )
+    _SUMMARY_TAIL = (
+        f"\n{Color.CYAN}🔑 默认管理员账户:{Color.RESET}\n"
+        f"   👤 用户名: {Color.YELLOW}admin{Color.RESET}\n"
+        f"   🔑 密码: {Color.YELLOW}admin123456{Color.RESET}\n"
+        f"\n{Color.CYAN}📋 使用说明:{Color.RESET}\n"
+        "   1. 访问前端界面开始使用\n"
+        "   2. 使用默认账户登录或注册新用户\n"
+        "   3. 创建小说项目开始创作\n"
+        "   4. 如果需要AI功能，请配置API密钥\n"
+        f"\n{Color.CYAN}🔧 常用命令:{Color.RESET}\n"
+        f"   停止服务: {Color.YELLOW}docker-compose down{Color.RESET}\n"
+        f"   查看日志: {Color.YELLOW}docker-compose logs{Color.RESET}\n"
+        f"   重启服务: {Color.YELLOW}docker-compose restart{Color.RESET}\n"
+        f"   监控服务: {Color.YELLOW}python3 super_launcher.py --monitor{Color.RESET}\n"
+        f"\n{Color.GREEN}✨ 享受您的AI小说创作之旅！{Color.RESET}\n"
+    )
+    
+    _MONITOR_MENU = (
+        "🔧 快速操作:\n"
+        "  [1] 查看日志\n"
+        "  [2] 重启服务\n"
+        "  [3] 停止服务\n"
+        "  [4] 刷新状态\n"
+        "  [0] 退出\n"
+        f"\n{'=' * 60}"
+    )
+    
+    # 安装步骤依赖关系：步骤方法名 -> 需先完成的步骤
+    _STEP_DEPS = {
+        "update_system": [],
+        "install_dependencies": ["update_system"],
+        "configure_docker_mirror": ["install_dependencies"],
+        "install_docker": ["install_dependencies", "configure_docker_mirror"],
+        "verify_docker_installation": ["install_docker"],
+        "setup_project_structure": [],
+        "check_python_environment": [],
+        "init_database": ["setup_project_structure"],
+        "check_project_files": [],
+        "test_docker_compose_syntax": ["verify_docker_installation", "check_project_files"]
+    }
+    # 串行的系统包/Docker安装链：会调用sudo、apt、os.system等直接输出到终端，
+    # 其输出不缓存，运行期间暂不写出其他步骤的输出
+    _LIVE_STEPS = frozenset({
+        "update_system", "install_dependencies", "configure_docker_mirror",
+        "install_docker", "verify_docker_installation"
+    })
+    
+    def __init__(self, exhaustive: bool = False):
         self.project_root = Path(__file__).parent
+        # 是否执行完整检查（如镜像拉取测试）
+        self.exhaustive = exhaustive
         self.issues = []
         self.warnings = []
         self.fixes_applied = []
@@ -74,53 +224,127 @@ class SuperLauncher:
                 "error_count": 0
             }
         }
+        # 最近一轮探测结果，供验证部署和总结输出复用
+        self._last_probe = {"backend": None, "frontend": None, "agent_count": None, "env_info": None}
+        # docker info 检查结果缓存
+        self._docker_ready_cache = None
+        # 并发执行安装步骤时保证输出不交错
+        self._print_lock = threading.Lock()
+        # 工作线程中执行安装步骤时的输出缓冲，步骤结束后整段写出
+        self._step_output = threading.local()
+        # 服务健康检查线程池
+        self._health_executor = ThreadPoolExecutor(max_workers=8)
+        # 容器列表缓存：(获取时间, 容器列表)
+        self._docker_cache = (0.0, None)
+        # 上次绘制的监控面板摘要
+        self._last_sig = None
+        # 交互菜单文本
+        self._menu_text = (
+            f"\n{Color.BOLD}{Color.CYAN}请选择操作:{Color.RESET}\n"
+            f"{Color.GREEN}1. 完整安装部署 (推荐){Color.RESET} - 安装Docker + 环境检查 + 启动服务\n"
+            f"{Color.BLUE}2. 快速启动{Color.RESET} - 一键启动，跳过详细检查\n"
+            f"{Color.YELLOW}3. 环境检查{Color.RESET} - 仅检查环境，不启动服务\n"
+            f"{Color.PURPLE}4. 服务监控{Color.RESET} - 实时监控服务状态\n"
+            f"{Color.CYAN}5. 快速检查{Color.RESET} - 检查当前服务状态\n"
+            f"{Color.MAGENTA}6. 环境检测{Color.RESET} - 检测网络和IP信息\n"
+            f"{Color.RED}0. 退出{Color.RESET}\n"
+        )
+    
+    @cached_property
+    def _requests(self):
+        """按需导入requests，仅安装流程时无需承担其导入开销"""
+        import requests
+        return requests
+    
+    @cached_property
+    def _aiohttp(self):
+        """按需导入aiohttp，只有监控模式用于异步并发探测；未安装时为None"""
+        try:
+            import aiohttp
+        except ImportError:
+            return None
+        return aiohttp
+    
+    def _make_session(self, retries) -> Any:
+        """创建复用keep-alive连接的HTTP会话"""
+        from requests.adapters import HTTPAdapter
+        
+        session = self._requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        atexit.register(session.close)
+        return session
+    
+    @cached_property
+    def http(self):
+        """服务探测共用的HTTP会话；不重试，超时和错误状态码按原样反映到探测结果"""
+        from requests.adapters import Retry
+        return self._make_session(Retry(total=0, read=False, redirect=False))
+    
+    @cached_property
+    def http_retry(self):
+        """部署验证使用的HTTP会话，对网关类错误做少量重试"""
+        from requests.adapters import Retry
+        return self._make_session(Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]))
+    
+    def _write(self, text: str):
+        """一次性写出整段文本"""
+        with self._print_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
     
     def print_banner(self):
         """打印横幅"""
-        print(f"{Color.BOLD}{Color.CYAN}")
-        print("╔══════════════════════════════════════════════════════════════╗")
-        print("║              🚀 GoodTxt 超级启动器 v2.0 🚀                  ║")
-        print("║          多AI协同小说生成系统智能管理                   ║")
-        print("║                    一站式解决方案                         ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
-        print(f"{Color.RESET}")
+        self._write(self._BANNER)
     
     def print_header(self):
         """打印标题"""
-        print(f"{Color.BOLD}{Color.CYAN}")
-        print("=" * 80)
-        print("🚀 GoodTxt 多AI协同小说生成系统 - 智能管理系统")
-        print("=" * 80)
-        print(f"{Color.RESET}")
+        self._write(self._HEADER)
+    
+    def _emit(self, line: str):
+        """输出一行；在安装步骤的工作线程中时先写入该步骤的缓冲区"""
+        lines = getattr(self._step_output, "lines", None)
+        if lines is not None:
+            lines.append(line)
+        else:
+            self._write(f"{line}\n")
     
     def print_step(self, step_num: int, total: int, title: str):
         """打印步骤"""
-        print(f"{Color.BLUE}[{step_num}/{total}] {Color.BOLD}{title}{Color.RESET}")
+        self._emit(f"{Color.BLUE}[{step_num}/{total}] {Color.BOLD}{title}{Color.RESET}")
+    
+    def _format_status(self, message: str, status: str = "info") -> str:
+        """格式化状态信息"""
+        return self._STATUS.get(status, self._STATUS["info"]).format(message)
     
     def print_status(self, message: str, status: str = "info"):
         """打印状态信息"""
-        if status == "success":
-            print(f"  {Color.GREEN}✅ {message}{Color.RESET}")
-        elif status == "warning":
-            print(f"  {Color.YELLOW}⚠️  {message}{Color.RESET}")
-        elif status == "error":
-            print(f"  {Color.RED}❌ {message}{Color.RESET}")
-        elif status == "info":
-            print(f"  {Color.CYAN}ℹ️  {message}{Color.RESET}")
-        elif status == "fix":
-            print(f"  {Color.PURPLE}🔧 {message}{Color.RESET}")
-        elif status == "install":
-            print(f"  {Color.BLUE}📦 {message}{Color.RESET}")
-    
-    def run_command(self, command: str, capture_output: bool = True, timeout: int = 30) -> Tuple[bool, str, str]:
-        """执行命令"""
+        self._emit(self._format_status(message, status))
+    
+    def run_command(self, command: Union[List[str], str], capture_output: bool = True, timeout: int = 30,
+                    discard: bool = False) -> Tuple[bool, str, str]:
+        """执行命令，列表形式的参数直接执行而不经过shell；discard为True时丢弃输出只返回执行结果"""
         try:
+            if discard:
+                result = subprocess.run(
+                    command,
+                    shell=isinstance(command, str),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=timeout,
+                    env=COMMAND_ENV
+                )
+                return result.returncode == 0, "", ""
+            
             result = subprocess.run(
                 command, 
-                shell=True, 
+                shell=isinstance(command, str), 
                 capture_output=capture_output, 
                 text=True, 
-                timeout=timeout
+                timeout=timeout,
+                env=COMMAND_ENV
             )
             return result.returncode == 0, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
@@ -128,6 +352,16 @@ class SuperLauncher:
         except Exception as e:
             return False, "", str(e)
     
+    def _docker_ready(self) -> bool:
+        """检查Docker守护进程是否可用（结果缓存）"""
+        if self._docker_ready_cache is None:
+            try:
+                result = subprocess.run(["docker", "info"], capture_output=True, text=True, timeout=5)
+                self._docker_ready_cache = result.returncode == 0
+            except (subprocess.TimeoutExpired, OSError):
+                self._docker_ready_cache = False
+        return self._docker_ready_cache
+    
     def get_local_ip(self):
         """获取本地IP地址"""
         try:
@@ -136,7 +370,7 @@ class SuperLauncher:
             local_ip = s.getsockname()[0]
             s.close()
             return local_ip
-        except:
+        except OSError:
             return "127.0.0.1"
     
     def get_public_ip(self):
@@ -151,20 +385,30 @@ class SuperLauncher:
             
             for service in services:
                 try:
-                    response = requests.get(service, timeout=3)
+                    response = self._requests.get(service, timeout=3)
                     if response.status_code == 200:
-                        public_ip = response.text.strip()
-                        if public_ip and len(public_ip.split('.')) == 4:
-                            return public_ip
-                except:
+                        raw = response.content.strip()
+                        if _IPV4_RE.match(raw):
+                            # 进一步校验每段数值范围
+                            return str(ipaddress.IPv4Address(raw.decode()))
+                except (self._requests.exceptions.RequestException, ValueError):
                     continue
             
             return None
-        except:
+        except ImportError:
             return None
     
     def detect_environment(self):
-        """检测当前环境类型"""
+        """检测当前环境类型（结果缓存ENV_CACHE_TTL秒）"""
+        return self._detect_environment(int(time.monotonic() // ENV_CACHE_TTL))
+    
+    def _env_cache_clear(self):
+        """清除环境检测缓存，下次调用时重新检测"""
+        self._detect_environment.cache_clear()
+    
+    @lru_cache(maxsize=1)
+    def _detect_environment(self, cache_key: int):
+        """实际执行环境检测，cache_key为TTL时间片编号"""
         local_ip = self.get_local_ip()
         public_ip = self.get_public_ip()
         
@@ -191,11 +435,14 @@ class SuperLauncher:
     
     def detect_os(self):
         """检测操作系统"""
-        if platform.system() == "Windows":
+        import platform
+        
+        system = platform.system()
+        if system == "Windows":
             return "windows"
-        elif platform.system() == "Darwin":
+        elif system == "Darwin":
             return "macos"
-        elif platform.system() == "Linux":
+        elif system == "Linux":
             if os.path.exists("/etc/debian_version"):
                 return "debian"
             elif os.path.exists("/etc/redhat-release"):
@@ -219,14 +466,14 @@ class SuperLauncher:
         os_type = self.detect_os()
         
         if os_type in ["debian", "ubuntu"]:
-            success, stdout, stderr = self.run_command("sudo apt update -y")
+            success, stdout, stderr = self.run_command(["sudo", "apt", "update", "-y"], discard=True)
             if success:
                 self.print_status("系统包更新成功", "success")
             else:
                 self.print_status("系统包更新失败", "warning")
         
         elif os_type in ["redhat", "centos"]:
-            success, stdout, stderr = self.run_command("sudo yum update -y")
+            success, stdout, stderr = self.run_command(["sudo", "yum", "update", "-y"], discard=True)
             if success:
                 self.print_status("系统包更新成功", "success")
             else:
@@ -242,14 +489,14 @@ class SuperLauncher:
         
         if os_type == "debian":
             packages = ["curl", "wget", "git", "python3", "python3-pip", "build-essential"]
-            success, stdout, stderr = self.run_command(f"sudo apt install -y {' '.join(packages)}")
+            success, stdout, stderr = self.run_command(["sudo", "apt", "install", "-y", *packages], discard=True)
         elif os_type == "redhat":
             packages = ["curl", "wget", "git", "python3", "python3-pip", "gcc", "gcc-c++", "make"]
-            success, stdout, stderr = self.run_command(f"sudo yum install -y {' '.join(packages)}")
+            success, stdout, stderr = self.run_command(["sudo", "yum", "install", "-y", *packages], discard=True)
         elif os_type == "macos":
-            success, stdout, stderr = self.run_command("brew install git python3")
+            success, stdout, stderr = self.run_command(["brew", "install", "git", "python3"], discard=True)
         else:
-            success, stdout, stderr = self.run_command("curl -fsSL https://get.docker.com -o get-docker.sh && sh get-docker.sh")
+            success, stdout, stderr = self.run_command("curl -fsSL https://get.docker.com -o get-docker.sh && sh get-docker.sh", discard=True)
         
         if success:
             self.print_status("基础依赖安装成功", "success")
@@ -266,7 +513,7 @@ class SuperLauncher:
         
         if os_type in ["debian", "redhat", "linux"]:
             # 创建Docker配置目录
-            os.system("sudo mkdir -p /etc/docker")
+            self.run_command(["sudo", "mkdir", "-p", "/etc/docker"], discard=True)
             
             # 创建daemon.json配置文件
             daemon_config = {
@@ -285,7 +532,7 @@ class SuperLauncher:
             }
             
             config_content = json.dumps(daemon_config, indent=2)
-            os.system(f"echo '{config_content}' | sudo tee /etc/docker/daemon.json > /dev/null")
+            self.run_command(f"echo '{config_content}' | sudo tee /etc/docker/daemon.json", discard=True)
             
             self.print_status("Docker镜像源配置完成", "success")
         
@@ -336,6 +583,9 @@ class SuperLauncher:
         # 添加当前用户到docker组
         os.system("sudo usermod -aG docker $USER")
         
+        # 安装后需要重新检查守护进程状态
+        self._docker_ready_cache = None
+        
         self.print_status("Docker安装完成", "success")
         return True
     
@@ -344,33 +594,52 @@ class SuperLauncher:
         self.print_step(5, 10, "验证Docker安装")
         
         # 检查Docker
-        success, stdout, stderr = self.run_command("docker --version")
+        success, stdout, stderr = self.run_command(["docker", "--version"])
         if success:
             self.print_status(f"Docker版本: {stdout.strip()}", "success")
         else:
             self.print_status("Docker未安装", "error")
             return False
         
+        # 检查Docker守护进程（无需网络）
+        success, stdout, stderr = self.run_command(["docker", "info", "--format", "{{.ServerVersion}}"], timeout=5)
+        self._docker_ready_cache = success
+        if success:
+            self.print_status(f"Docker守护进程 v{stdout.strip()} 运行正常", "success")
+        else:
+            self.print_status("Docker守护进程未运行", "warning")
+        
         # 检查Docker Compose
-        success, stdout, stderr = self.run_command("docker compose --version")
+        success, stdout, stderr = self.run_command(["docker", "compose", "--version"])
         if not success:
-            success, stdout, stderr = self.run_command("docker-compose --version")
+            success, stdout, stderr = self.run_command(["docker-compose", "--version"])
         
         if success:
             self.print_status(f"Docker Compose版本: {stdout.strip()}", "success")
         else:
             self.print_status("Docker Compose未安装", "warning")
         
-        # 测试Docker镜像拉取
-        success, stdout, stderr = self.run_command("docker pull hello-world")
-        if success:
-            self.print_status("Docker镜像拉取正常", "success")
-            os.system("docker rmi hello-world > /dev/null 2>&1 || true")
-        else:
-            self.print_status("Docker镜像拉取可能有问题", "warning")
+        # 测试Docker镜像拉取（仅完整检查模式）
+        if self.exhaustive:
+            success, stdout, stderr = self.run_command(["docker", "image", "inspect", "hello-world"])
+            if not success:
+                success, stdout, stderr = self.run_command(["docker", "pull", "hello-world"])
+            if success:
+                self.print_status("Docker镜像拉取正常", "success")
+            else:
+                self.print_status("Docker镜像拉取可能有问题", "warning")
         
         return True
     
+    @staticmethod
+    def _scan_names(directory: Path) -> set:
+        """一次性列出目录下的所有条目名称，目录不存在时返回空集合"""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+    
     def setup_project_structure(self):
         """设置项目结构"""
         self.print_step(6, 10, "设置项目结构")
@@ -387,12 +656,17 @@ class SuperLauncher:
         ]
         
         created_dirs = []
+        # 每个父目录只扫描一次
+        listings = {}
         
         for dir_path in required_dirs:
             full_path = self.project_root / dir_path
-            if not full_path.exists():
+            if full_path.parent not in listings:
+                listings[full_path.parent] = self._scan_names(full_path.parent)
+            if full_path.name not in listings[full_path.parent]:
                 try:
                     full_path.mkdir(parents=True, exist_ok=True)
+                    listings[full_path.parent].add(full_path.name)
                     created_dirs.append(dir_path)
                     self.print_status(f"创建目录: {dir_path}", "fix")
                 except Exception as e:
@@ -420,7 +694,7 @@ class SuperLauncher:
             self.print_status("Python版本满足要求", "success")
         
         # 检查pip
-        success, stdout, stderr = self.run_command("pip3 --version")
+        success, stdout, stderr = self.run_command(["pip3", "--version"])
         if success:
             self.print_status(f"pip版本: {stdout.strip()}", "success")
         else:
@@ -435,7 +709,7 @@ class SuperLauncher:
         db_script_path = self.project_root / "scripts" / "init_database.py"
         
         if db_script_path.exists():
-            success, stdout, stderr = self.run_command(f"python3 {db_script_path}")
+            success, stdout, stderr = self.run_command(["python3", str(db_script_path)])
             if success:
                 self.print_status("数据库初始化成功", "success")
                 self.fixes_applied.append("数据库初始化")
@@ -547,6 +821,9 @@ class SuperLauncher:
         );
         """
         
+        import sqlite3
+        import hashlib
+        
         # 创建数据库连接并执行SQL
         conn = sqlite3.connect(str(db_path))
         cursor = conn.cursor()
@@ -566,6 +843,36 @@ class SuperLauncher:
         conn.commit()
         conn.close()
     
+    # 查找项目文件时不进入的目录
+    _WALK_SKIP_DIRS = {"node_modules", ".git", ".venv", "data"}
+    
+    def _find_files(self, relative_paths: List[str]) -> set:
+        """单次遍历项目目录，返回实际存在的相对路径集合"""
+        # 转为绝对路径，与os.walk返回的路径保持同一形式（相对根目录会得到"./xxx"）
+        root_dir = os.path.abspath(str(self.project_root))
+        required = {os.path.normpath(os.path.join(root_dir, p)): p for p in relative_paths}
+        # 只进入包含目标文件的目录
+        wanted_dirs = set()
+        for path in required:
+            parent = os.path.dirname(path)
+            while len(parent) > len(root_dir):
+                wanted_dirs.add(parent)
+                parent = os.path.dirname(parent)
+        
+        found = set()
+        for current, dirs, files in os.walk(root_dir):
+            dirs[:] = [
+                d for d in dirs
+                if d not in self._WALK_SKIP_DIRS and os.path.join(current, d) in wanted_dirs
+            ]
+            for name in files:
+                path = os.path.join(current, name)
+                if path in required:
+                    found.add(required[path])
+            if len(found) == len(required):
+                break
+        return found
+    
     def check_project_files(self):
         """检查项目文件"""
         self.print_step(9, 10, "检查项目文件")
@@ -578,10 +885,11 @@ class SuperLauncher:
             "frontend/package.json"
         ]
         
+        found = self._find_files(required_files)
+        
         missing_files = []
         for file_path in required_files:
-            full_path = self.project_root / file_path
-            if full_path.exists():
+            if file_path in found:
                 self.print_status(f"文件存在: {file_path}", "success")
             else:
                 missing_files.append(file_path)
@@ -597,7 +905,7 @@ class SuperLauncher:
         """测试Docker Compose语法"""
         self.print_step(10, 10, "验证Docker Compose配置")
         
-        success, stdout, stderr = self.run_command("docker-compose config")
+        success, stdout, stderr = self.run_command(["docker-compose", "config"])
         if success:
             self.print_status("Docker Compose配置语法正确", "success")
         else:
@@ -607,6 +915,64 @@ class SuperLauncher:
         
         return True
     
+    def _run_step(self, func, buffered: bool) -> Tuple[Any, List[str], Optional[Exception]]:
+        """在工作线程中执行安装步骤，buffered为True时缓存其输出，返回(结果, 输出行, 异常)"""
+        lines = []
+        if buffered:
+            self._step_output.lines = lines
+        try:
+            return func(), lines, None
+        except Exception as e:
+            return False, lines, e
+        finally:
+            self._step_output.lines = None
+    
+    def _run_steps(self, steps: List[Tuple[str, Any]]) -> int:
+        """按依赖关系并发执行安装步骤，返回成功的步骤数"""
+        pending = {func.__name__: (name, func) for name, func in steps}
+        deps = {
+            step: [d for d in self._STEP_DEPS.get(step, []) if d in pending]
+            for step in pending
+        }
+        done = set()
+        running = {}
+        success_count = 0
+        # 已完成的并发步骤的输出，按步骤原有顺序写出
+        order = [step for step in pending if step not in self._LIVE_STEPS]
+        outputs = {}
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            while pending or running:
+                # 提交所有前置步骤已完成的步骤
+                for step in [s for s in pending if all(d in done for d in deps[s])]:
+                    name, func = pending.pop(step)
+                    buffered = step not in self._LIVE_STEPS
+                    running[executor.submit(self._run_step, func, buffered)] = (step, name)
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step, name = running.pop(future)
+                    done.add(step)
+                    result, lines, error = future.result()
+                    if error is not None:
+                        lines.append(self._format_status(f"{name}失败: {error}", "error"))
+                    elif result:
+                        success_count += 1
+                        lines.append("")
+                    text = "".join(f"{line}\n" for line in lines)
+                    if step in self._LIVE_STEPS:
+                        self._write(text)
+                    else:
+                        outputs[step] = text
+                
+                # 并发步骤的输出整段写出，不会相互交错；
+                # 串行安装链运行期间先不写出，避免插入其终端输出中间
+                if not any(step in self._LIVE_STEPS for step, _ in running.values()):
+                    while order and order[0] in outputs:
+                        self._write(outputs.pop(order.pop(0)))
+        
+        return success_count
+    
     def run_full_installation(self):
         """运行完整安装流程"""
         self.print_header()
@@ -615,27 +981,31 @@ class SuperLauncher:
         
         self.check_root()
         
-        steps = [
-            ("更新系统包", self.update_system),
-            ("安装基础依赖", self.install_dependencies),
-            ("配置Docker镜像源", self.configure_docker_mirror),
-            ("安装Docker", self.install_docker),
-            ("验证Docker安装", self.verify_docker_installation),
-            ("设置项目结构", self.setup_project_structure),
-            ("检查Python环境", self.check_python_environment),
-            ("初始化数据库", self.init_database),
-            ("检查项目文件", self.check_project_files),
-            ("验证Docker配置", self.test_docker_compose_syntax)
-        ]
+        if not self._docker_ready():
+            steps = [
+                ("更新系统包", self.update_system),
+                ("安装基础依赖", self.install_dependencies),
+                ("配置Docker镜像源", self.configure_docker_mirror),
+                ("安装Docker", self.install_docker),
+                ("验证Docker安装", self.verify_docker_installation),
+                ("设置项目结构", self.setup_project_structure),
+                ("检查Python环境", self.check_python_environment),
+                ("初始化数据库", self.init_database),
+                ("检查项目文件", self.check_project_files),
+                ("验证Docker配置", self.test_docker_compose_syntax)
+            ]
+        else:
+            # Docker已可用，跳过系统更新和Docker安装步骤
+            self.print_status("Docker已就绪，跳过系统更新和Docker安装", "info")
+            steps = [
+                ("设置项目结构", self.setup_project_structure),
+                ("检查Python环境", self.check_python_environment),
+                ("初始化数据库", self.init_database),
+                ("检查项目文件", self.check_project_files),
+                ("验证Docker配置", self.test_docker_compose_syntax)
+            ]
         
-        success_count = 0
-        for i, (name, func) in enumerate(steps, 1):
-            try:
-                if func():
-                    success_count += 1
-                    print()
-            except Exception as e:
-                self.print_status(f"{name}失败: {e}", "error")
+        success_count = self._run_steps(steps)
         
         print(f"\n{Color.BOLD}{Color.GREEN}安装完成: {success_count}/{len(steps)} 步骤成功{Color.RESET}")
         
@@ -678,8 +1048,12 @@ class SuperLauncher:
         
         print("正在等待服务启动...")
         
+        # 重新开始一轮探测，不复用上一次部署的结果
+        self._last_probe = {"backend": None, "frontend": None, "agent_count": None, "env_info": None}
+        
         # 获取环境信息
         env_info = self.detect_environment()
+        self._last_probe["env_info"] = env_info
         backend_url = env_info["backend_url"]
         frontend_url = env_info["frontend_url"]
         
@@ -692,14 +1066,16 @@ class SuperLauncher:
             print(f"\r等待中... {elapsed}s / {timeout}s", end="", flush=True)
             
             # 检查后端
-            try:
-                response = requests.get(backend_url, timeout=5)
-                if response.status_code == 200:
-                    backend_healthy = True
-                    print(f"\n{Color.GREEN}✅ 后端服务已就绪！{Color.RESET}")
-                    break
-            except:
-                pass
+            status, body = self._probe(backend_url, 2)
+            if status == 200:
+                backend_healthy = True
+                self._last_probe["backend"] = status
+                try:
+                    self._last_probe["agent_count"] = json.loads(body).get("total_agents", 0)
+                except (ValueError, AttributeError):
+                    self._last_probe["agent_count"] = 0
+                print(f"\n{Color.GREEN}✅ 后端服务已就绪！{Color.RESET}")
+                break
             
             time.sleep(3)
         
@@ -707,23 +1083,38 @@ class SuperLauncher:
         
         # 检查前端
         try:
-            response = requests.get(frontend_url, timeout=5)
+            response = self.http.get(frontend_url, timeout=5)
             if response.status_code == 200:
+                # 只缓存成功的结果；前端仍在启动时由verify_deployment重新探测
+                self._last_probe["frontend"] = response.status_code
                 frontend_healthy = True
                 print(f"{Color.GREEN}✅ 前端服务已就绪！{Color.RESET}")
-        except:
+        except self._requests.exceptions.RequestException:
             print(f"{Color.YELLOW}⚠️  前端服务检查超时，可能仍在启动中{Color.RESET}")
         
         return backend_healthy
     
-    def check_service(self, service_name: str) -> Dict:
-        """检查单个服务状态"""
+    def _probe(self, url: str, timeout: float) -> Tuple[Optional[int], bytes]:
+        """轻量HTTP探测，直接使用http.client，返回(状态码, 响应体)，连接失败时状态码为None"""
+        parts = urllib.parse.urlsplit(url)
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+        try:
+            conn.request("GET", parts.path or "/")
+            response = conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            return None, b""
+        finally:
+            conn.close()
+    
+    def check_service(self, service_name: str, now: Optional[datetime] = None) -> Dict:
+        """检查单个服务状态，now为本轮检查的时间戳（批量检查时共用）"""
         service = self.services[service_name]
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            response = requests.get(service["url"], timeout=10)
-            response_time = time.time() - start_time
+            response = self.http.get(service["url"], timeout=HEALTH_TIMEOUT)
+            response_time = time.monotonic() - start_time
             
             if response.status_code == 200:
                 status = "healthy"
@@ -732,21 +1123,21 @@ class SuperLauncher:
                 # 检查具体内容
                 if service_name == "backend" and service["check_url"]:
                     try:
-                        agents_response = requests.get(service["check_url"], timeout=5)
+                        agents_response = self.http.get(service["check_url"], timeout=HEALTH_TIMEOUT)
                         if agents_response.status_code == 200:
                             agents_data = agents_response.json()
                             service["agent_count"] = agents_data.get("total_agents", 0)
-                    except:
+                    except (self._requests.exceptions.RequestException, ValueError):
                         service["agent_count"] = "unknown"
             else:
                 status = "unhealthy"
                 service["error_count"] += 1
                 
-        except requests.exceptions.Timeout:
+        except self._requests.exceptions.ReadTimeout:
             status = "timeout"
-            response_time = 10.0
+            response_time = time.monotonic() - start_time
             service["error_count"] += 1
-        except requests.exceptions.ConnectionError:
+        except (self._requests.exceptions.ConnectTimeout, self._requests.exceptions.ConnectionError):
             status = "connection_error"
             response_time = None
             service["error_count"] += 1
@@ -757,18 +1148,91 @@ class SuperLauncher:
         
         # 更新服务状态
         service["status"] = status
-        service["last_check"] = datetime.now()
+        service["last_check"] = now or datetime.now()
         service["response_time"] = response_time
         
         return service
     
+    def _is_connect_timeout(self, error: Exception) -> bool:
+        """判断aiohttp超时是否发生在建立连接阶段"""
+        connect_timeout = getattr(self._aiohttp, "ConnectionTimeoutError", None)
+        if connect_timeout is not None:
+            return isinstance(error, connect_timeout)
+        # aiohttp 3.10之前连接超时与读取超时同为ServerTimeoutError，只能按消息区分
+        return isinstance(error, self._aiohttp.ServerTimeoutError) and str(error).startswith("Connection timeout")
+    
+    async def _check_service_async(self, session, service_name: str, now: Optional[datetime] = None) -> Dict:
+        """异步检查单个服务状态，逻辑与check_service一致"""
+        import asyncio
+        
+        service = self.services[service_name]
+        aiohttp = self._aiohttp
+        timeout = aiohttp.ClientTimeout(sock_connect=HEALTH_TIMEOUT[0], sock_read=HEALTH_TIMEOUT[1])
+        start_time = time.monotonic()
+        
+        try:
+            async with session.get(service["url"], timeout=timeout) as response:
+                response_time = time.monotonic() - start_time
+                status_code = response.status
+            
+            if status_code == 200:
+                status = "healthy"
+                service["error_count"] = 0
+                
+                # 检查具体内容
+                if service_name == "backend" and service["check_url"]:
+                    try:
+                        async with session.get(service["check_url"], timeout=timeout) as agents_response:
+                            if agents_response.status == 200:
+                                agents_data = await agents_response.json(content_type=None)
+                                service["agent_count"] = agents_data.get("total_agents", 0)
+                    except Exception:
+                        service["agent_count"] = "unknown"
+            else:
+                status = "unhealthy"
+                service["error_count"] += 1
+                
+        except asyncio.TimeoutError as e:
+            # 与同步路径保持一致：连接超时归为connection_error，读取超时归为timeout
+            if self._is_connect_timeout(e):
+                status = "connection_error"
+                response_time = None
+            else:
+                status = "timeout"
+                response_time = time.monotonic() - start_time
+            service["error_count"] += 1
+        except aiohttp.ClientConnectionError:
+            status = "connection_error"
+            response_time = None
+            service["error_count"] += 1
+        except Exception:
+            status = "error"
+            response_time = None
+            service["error_count"] += 1
+        
+        # 更新服务状态
+        service["status"] = status
+        service["last_check"] = now or datetime.now()
+        service["response_time"] = response_time
+        
+        return service
+    
+    async def _check_services_async(self, session, now: Optional[datetime] = None) -> List[Dict]:
+        """并发检查所有服务"""
+        import asyncio
+        
+        return await asyncio.gather(
+            *[self._check_service_async(session, name, now) for name in self.services]
+        )
+    
     def verify_deployment(self):
         """验证部署"""
         print(f"\n{Color.BOLD}{Color.PURPLE}🔍 验证部署{Color.RESET}")
         print("=" * 50)
         
-        # 获取环境信息
-        env_info = self.detect_environment()
+        # 获取环境信息（优先复用等待阶段的结果）
+        env_info = self._last_probe["env_info"] or self.detect_environment()
+        self._last_probe["env_info"] = env_info
         backend_url = env_info["backend_url"]
         frontend_url = env_info["frontend_url"]
         
@@ -776,67 +1240,60 @@ class SuperLauncher:
         self.services["backend"]["url"] = backend_url
         self.services["frontend"]["url"] = frontend_url
         
-        # 检查后端API
-        try:
-            response = requests.get(backend_url, timeout=10)
-            if response.status_code == 200:
-                agents_data = response.json()
-                agent_count = agents_data.get("total_agents", 0)
-                print(f"{Color.GREEN}✅ 后端API正常工作{Color.RESET}")
-                print(f"{Color.CYAN}ℹ️  已配置AI代理数量: {agent_count}{Color.RESET}")
-                
-                if agent_count == 0:
-                    print(f"{Color.YELLOW}💡 提示: 当前未配置AI API密钥，AI功能暂时不可用{Color.RESET}")
-                    print(f"{Color.CYAN}   要启用AI功能，请编辑 docker-compose.yml 添加API密钥{Color.RESET}")
-            else:
-                print(f"{Color.RED}❌ 后端API返回错误: {response.status_code}{Color.RESET}")
+        # 检查后端API，等待阶段已探测成功时直接使用缓存结果
+        if self._last_probe["backend"] is None:
+            try:
+                response = self.http_retry.get(backend_url, timeout=10)
+                self._last_probe["backend"] = response.status_code
+                if response.status_code == 200:
+                    self._last_probe["agent_count"] = response.json().get("total_agents", 0)
+            except Exception as e:
+                print(f"{Color.RED}❌ 后端API连接失败: {e}{Color.RESET}")
                 return False
-        except Exception as e:
-            print(f"{Color.RED}❌ 后端API连接失败: {e}{Color.RESET}")
+        
+        backend_status = self._last_probe["backend"]
+        if backend_status == 200:
+            agent_count = self._last_probe["agent_count"]
+            print(f"{Color.GREEN}✅ 后端API正常工作{Color.RESET}")
+            print(f"{Color.CYAN}ℹ️  已配置AI代理数量: {agent_count}{Color.RESET}")
+            
+            if agent_count == 0:
+                print(f"{Color.YELLOW}💡 提示: 当前未配置AI API密钥，AI功能暂时不可用{Color.RESET}")
+                print(f"{Color.CYAN}   要启用AI功能，请编辑 docker-compose.yml 添加API密钥{Color.RESET}")
+        else:
+            print(f"{Color.RED}❌ 后端API返回错误: {backend_status}{Color.RESET}")
             return False
         
         # 检查前端
-        try:
-            response = requests.get(frontend_url, timeout=10)
-            if response.status_code == 200:
-                print(f"{Color.GREEN}✅ 前端服务正常{Color.RESET}")
-            else:
-                print(f"{Color.YELLOW}⚠️  前端服务返回: {response.status_code}{Color.RESET}")
-        except Exception as e:
-            print(f"{Color.YELLOW}⚠️  前端服务检查失败: {e}{Color.RESET}")
+        if self._last_probe["frontend"] is None:
+            try:
+                response = self.http_retry.get(frontend_url, timeout=10)
+                self._last_probe["frontend"] = response.status_code
+            except Exception as e:
+                print(f"{Color.YELLOW}⚠️  前端服务检查失败: {e}{Color.RESET}")
+                return True
+        
+        frontend_status = self._last_probe["frontend"]
+        if frontend_status == 200:
+            print(f"{Color.GREEN}✅ 前端服务正常{Color.RESET}")
+        else:
+            print(f"{Color.YELLOW}⚠️  前端服务返回: {frontend_status}{Color.RESET}")
         
         return True
     
     def print_success_summary(self):
         """打印成功总结"""
-        print(f"\n{Color.BOLD}{Color.GREEN}🎉 部署成功！{Color.RESET}")
-        print("=" * 50)
-        
         # 获取环境信息
-        env_info = self.detect_environment()
-        
-        print(f"{Color.CYAN}📱 访问地址:{Color.RESET}")
-        print(f"   🌐 前端界面: {Color.BLUE}{env_info['frontend_url']}{Color.RESET}")
-        print(f"   🔧 后端API: {Color.BLUE}{env_info['backend_url']}{Color.RESET}")
-        print(f"   📚 API文档: {Color.BLUE}{env_info['docs_url']}{Color.RESET}")
-        
-        print(f"\n{Color.CYAN}🔑 默认管理员账户:{Color.RESET}")
-        print(f"   👤 用户名: {Color.YELLOW}admin{Color.RESET}")
-        print(f"   🔑 密码: {Color.YELLOW}admin123456{Color.RESET}")
-        
-        print(f"\n{Color.CYAN}📋 使用说明:{Color.RESET}")
-        print(f"   1. 访问前端界面开始使用")
-        print(f"   2. 使用默认账户登录或注册新用户")
-        print(f"   3. 创建小说项目开始创作")
-        print(f"   4. 如果需要AI功能，请配置API密钥")
-        
-        print(f"\n{Color.CYAN}🔧 常用命令:{Color.RESET}")
-        print(f"   停止服务: {Color.YELLOW}docker-compose down{Color.RESET}")
-        print(f"   查看日志: {Color.YELLOW}docker-compose logs{Color.RESET}")
-        print(f"   重启服务: {Color.YELLOW}docker-compose restart{Color.RESET}")
-        print(f"   监控服务: {Color.YELLOW}python3 super_launcher.py --monitor{Color.RESET}")
-        
-        print(f"\n{Color.GREEN}✨ 享受您的AI小说创作之旅！{Color.RESET}")
+        env_info = self._last_probe["env_info"] or self.detect_environment()
+        
+        self._write(
+            f"{self._SUMMARY_HEAD}"
+            f"{Color.CYAN}📱 访问地址:{Color.RESET}\n"
+            f"   🌐 前端界面: {Color.BLUE}{env_info['frontend_url']}{Color.RESET}\n"
+            f"   🔧 后端API: {Color.BLUE}{env_info['backend_url']}{Color.RESET}\n"
+            f"   📚 API文档: {Color.BLUE}{env_info['docs_url']}{Color.RESET}\n"
+            f"{self._SUMMARY_TAIL}"
+        )
     
     def run_quick_start(self):
         """快速启动"""
@@ -864,12 +1321,12 @@ class SuperLauncher:
         print("\n4. 检查服务状态...")
         env_info = self.detect_environment()
         try:
-            response = requests.get(env_info["backend_url"], timeout=10)
+            response = self.http.get(env_info["backend_url"], timeout=HEALTH_TIMEOUT)
             if response.status_code == 200:
                 print("✅ 后端服务正常")
             else:
                 print(f"⚠️  后端状态: {response.status_code}")
-        except:
+        except self._requests.exceptions.RequestException:
             print("⚠️  后端检查失败，可能仍在启动中")
         
         # 获取访问地址
@@ -881,21 +1338,72 @@ class SuperLauncher:
         print("\n✅ 快速启动完成！")
         return True
     
+    def _check_services(self, now: Optional[datetime] = None):
+        """并发检查所有服务，按完成顺序逐个返回服务状态"""
+        futures = {
+            self._health_executor.submit(self.check_service, name, now): name
+            for name in self.services
+        }
+        try:
+            for future in as_completed(futures, timeout=HEALTH_CHECK_BUDGET):
+                yield future.result()
+        except FuturesTimeoutError:
+            # 超出检查预算的服务直接标记为超时，避免拖慢整体刷新
+            for future, name in futures.items():
+                if not future.done():
+                    service = self.services[name]
+                    service["status"] = "timeout"
+                    service["last_check"] = now or datetime.now()
+                    service["response_time"] = None
+                    yield service
+    
+    @cached_property
+    def compose_project(self) -> str:
+        """docker compose项目名称（与compose的默认规则一致）"""
+        name = os.environ.get("COMPOSE_PROJECT_NAME") or self.project_root.resolve().name
+        return re.sub(r"[^a-z0-9_-]", "", name.lower())
+    
+    def _docker_containers(self, max_age: float = CONTAINER_CACHE_TTL) -> Optional[List[Dict]]:
+        """获取本项目的容器列表，命令失败时返回None；max_age秒内的缓存结果直接复用"""
+        now = time.monotonic()
+        cached_at, containers = self._docker_cache
+        if containers is not None and now - cached_at < max_age:
+            return containers
+        
+        # 直接使用docker ps按compose项目标签过滤，避免docker-compose重新解析配置
+        result = subprocess.run(
+            ["docker", "ps", "-a",
+             "--filter", f"label=com.docker.compose.project={self.compose_project}",
+             "--format", "{{json .}}"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            return None
+        
+        # 每行一个JSON对象，拼成数组一次解析；个别行损坏时再逐行解析
+        lines = [line for line in result.stdout.splitlines() if line.strip()]
+        try:
+            containers = json.loads('[' + ','.join(lines) + ']')
+        except json.JSONDecodeError:
+            containers = []
+            for line in lines:
+                try:
+                    containers.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        
+        self._docker_cache = (now, containers)
+        return containers
+    
     def run_quick_check(self):
         """快速服务检查"""
         print(f"{Color.CYAN}🔍 快速服务检查{Color.RESET}")
         print("=" * 40)
         
-        for service_name in self.services.keys():
-            service = self.check_service(service_name)
-            status_emoji = {
-                "healthy": "✅",
-                "unhealthy": "❌",
-                "timeout": "⏰", 
-                "connection_error": "🔌",
-                "error": "💥",
-                "unknown": "❓"
-            }.get(service["status"], "❓")
+        for service in self._check_services():
+            status_emoji = _STATUS_EMOJI.get(service["status"], "❓")
             
             print(f"{status_emoji} {service['name']}: {service['status']}")
             if service['response_time']:
@@ -904,110 +1412,218 @@ class SuperLauncher:
         
         # Docker状态
         try:
-            result = subprocess.run(
-                ["docker-compose", "ps", "--format", "json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            containers = self._docker_containers()
             
-            if result.returncode == 0:
+            if containers is not None:
                 print(f"\n🐳 Docker容器:")
-                containers = []
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        try:
-                            container_info = json.loads(line)
-                            containers.append(container_info)
-                        except json.JSONDecodeError:
-                            continue
-                
                 for container in containers:
                     state = container.get('State', 'unknown')
                     status_emoji = "🟢" if state == "running" else "🔴"
-                    print(f"{status_emoji} {container.get('Name', 'unknown')}: {state}")
-        except:
+                    print(f"{status_emoji} {container.get('Names', 'unknown')}: {state}")
+        except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError, OSError):
             print("\n🐳 无法获取Docker状态")
     
+    @staticmethod
+    def _monitor_title(now: datetime) -> str:
+        """监控面板标题行"""
+        return f"📊 GoodTxt 服务状态监控 - {now.strftime('%Y-%m-%d %H:%M:%S')}"
+    
+    def _monitor_signature(self, containers: Optional[List[Dict]]) -> int:
+        """面板内容摘要，用于判断两次刷新之间是否有变化"""
+        return hash((
+            tuple(
+                (name, svc["status"], round(svc["response_time"] or 0, 1), svc["error_count"], svc.get("agent_count"))
+                for name, svc in self.services.items()
+            ),
+            None if containers is None else tuple((c.get("Names"), c.get("State")) for c in containers)
+        ))
+    
+    def _format_monitor(self, now: datetime, containers: Optional[List[Dict]]) -> str:
+        """生成监控面板文本；各服务在同一轮中检查，检查时间统一显示在标题行"""
+        buf = [
+            "=" * 60,
+            self._monitor_title(now),
+            "=" * 60,
+            "",
+            "🔍 服务状态:"
+        ]
+        
+        # 服务状态
+        for service_name, service in self.services.items():
+            status_emoji = _STATUS_EMOJI.get(service["status"], "❓")
+            status_color = _STATUS_COLOR.get(service["status"], "\033[90m")
+            
+            response_time_str = f"{service['response_time']:.2f}s" if service['response_time'] else "N/A"
+            
+            buf.append(f"  {status_emoji} {service['name']}: {status_color}{service['status'].upper()}\033[0m")
+            buf.append(f"     URL: {service['url']}")
+            buf.append(f"     响应时间: {response_time_str}")
+            buf.append(f"     错误计数: {service['error_count']}")
+            
+            if service_name == "backend" and "agent_count" in service:
+                buf.append(f"     AI代理数量: {service['agent_count']}")
+            
+            buf.append("")
+        
+        # Docker容器状态
+        if containers is None:
+            buf.append("🐳 无法获取Docker状态")
+        else:
+            buf.append("🐳 Docker容器:")
+            for container in containers:
+                state = container.get('State', 'unknown')
+                buf.append(f"  {'🟢' if state == 'running' else '🔴'} {container.get('Names', 'unknown')}: {state}")
+        buf.append("")
+        
+        # 快速操作
+        buf.append(self._MONITOR_MENU)
+        return "\n".join(buf) + "\n"
+    
+    def _render_monitor(self, now: datetime):
+        """绘制监控面板，整屏内容一次写出；内容无变化时只更新标题行的时间"""
+        try:
+            containers = self._docker_containers(MONITOR_CONTAINER_TTL)
+        except (subprocess.SubprocessError, OSError):
+            containers = None
+        
+        sig = self._monitor_signature(containers)
+        if ANSI_ENABLED and sig == self._last_sig:
+            # 保存光标，跳到第2行重写标题并清除行尾，再恢复光标
+            self._write(f"\x1b7\x1b[2;1H{self._monitor_title(now)}\x1b[K\x1b8")
+            return
+        self._last_sig = sig
+        
+        text = self._format_monitor(now, containers)
+        if ANSI_ENABLED:
+            # 光标归位并清屏，与面板内容一起写出
+            self._write(_CLEAR + text)
+        else:
+            os.system('cls')
+            self._write(text)
+    
+    def _open_async_probe(self):
+        """创建监控期间常驻的事件循环和aiohttp会话，aiohttp不可用时返回None"""
+        aiohttp = self._aiohttp
+        if aiohttp is None:
+            return None
+        
+        # asyncio只在监控模式使用，按需导入
+        import asyncio
+        
+        async def create_session():
+            connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            return aiohttp.ClientSession(connector=connector)
+        
+        loop = asyncio.new_event_loop()
+        return loop, loop.run_until_complete(create_session())
+    
+    def _close_async_probe(self, probe):
+        """关闭监控用的aiohttp会话和事件循环"""
+        if probe is not None:
+            loop, session = probe
+            loop.run_until_complete(session.close())
+            loop.close()
+    
+    def _refresh_services(self, now: datetime, probe=None):
+        """刷新所有服务状态，有异步会话时用asyncio.gather并发探测，否则使用线程池"""
+        if probe is None:
+            list(self._check_services(now))
+            return
+        
+        loop, session = probe
+        loop.run_until_complete(self._check_services_async(session, now))
+    
+    def _wait_for_key(self, timeout: Optional[float]) -> Optional[str]:
+        """等待一次按键，timeout为None时一直等待；超时返回None"""
+        if os.name == 'nt':
+            import msvcrt
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while deadline is None or time.monotonic() < deadline:
+                if msvcrt.kbhit():
+                    return msvcrt.getwch()
+                time.sleep(0.1)
+            return None
+        
+        if not sys.stdin.isatty():
+            # 非交互输入时不读取按键，仅等待
+            if timeout is not None:
+                time.sleep(timeout)
+            return None
+        
+        # 直接从文件描述符读取：经过sys.stdin的缓冲时，连续输入的按键会滞留在
+        # Python缓冲区中而select感知不到
+        fd = sys.stdin.fileno()
+        ready, _, _ = select.select([fd], [], [], timeout)
+        return os.read(fd, 1).decode(errors="ignore") if ready else None
+    
+    def _handle_monitor_key(self, key: str) -> bool:
+        """处理监控面板的快捷操作，返回False表示退出监控"""
+        try:
+            if key == '0':
+                return False
+            elif key == '1':
+                subprocess.run(["docker-compose", "logs", "--tail", "50"])
+                print(f"\n{Color.GREEN}按任意键返回监控...{Color.RESET}")
+                self._wait_for_key(None)
+            elif key == '2':
+                print("重启服务中...")
+                subprocess.run(["docker-compose", "restart"])
+                self._docker_cache = (0.0, None)
+            elif key == '3':
+                print("停止服务中...")
+                subprocess.run(["docker-compose", "down"])
+                self._docker_cache = (0.0, None)
+            elif key == '4':
+                # 强制刷新：丢弃容器和环境检测缓存
+                self._docker_cache = (0.0, None)
+                self._env_cache_clear()
+        except OSError as e:
+            print(f"{Color.RED}❌ 操作失败: {e}{Color.RESET}")
+            time.sleep(2)
+        return True
+    
     def run_interactive_monitoring(self):
         """交互式监控"""
         print(f"启动服务监控...")
-        print(f"按 Ctrl+C 退出监控")
+        print(f"按 0 或 Ctrl+C 退出监控")
         time.sleep(2)
         
+        probe = self._open_async_probe()
+        # 终端切换到cbreak模式，按键无需回车即可读取
+        term_state = None
+        if os.name != 'nt' and sys.stdin.isatty():
+            import termios
+            import tty
+            term_state = termios.tcgetattr(sys.stdin.fileno())
+            tty.setcbreak(sys.stdin.fileno())
+        
         try:
             while True:
-                # 检查所有服务
-                for service_name in self.services.keys():
-                    self.check_service(service_name)
-                
-                # 清屏
-                os.system('clear' if os.name == 'posix' else 'cls')
-                
-                print(f"{'=' * 60}")
-                print(f"📊 GoodTxt 服务状态监控 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"{'=' * 60}")
-                
-                # 服务状态
-                print(f"\n🔍 服务状态:")
-                for service_name, service in self.services.items():
-                    status_emoji = {
-                        "healthy": "✅",
-                        "unhealthy": "❌", 
-                        "timeout": "⏰",
-                        "connection_error": "🔌",
-                        "error": "💥",
-                        "unknown": "❓"
-                    }.get(service["status"], "❓")
-                    
-                    status_color = {
-                        "healthy": "\033[92m",
-                        "unhealthy": "\033[91m",
-                        "timeout": "\033[93m", 
-                        "connection_error": "\033[91m",
-                        "error": "\033[91m",
-                        "unknown": "\033[90m"
-                    }.get(service["status"], "\033[90m")
-                    
-                    response_time_str = f"{service['response_time']:.2f}s" if service['response_time'] else "N/A"
-                    
-                    print(f"  {status_emoji} {service['name']}: {status_color}{service['status'].upper()}\033[0m")
-                    print(f"     URL: {service['url']}")
-                    print(f"     响应时间: {response_time_str}")
-                    print(f"     最后检查: {service['last_check'].strftime('%H:%M:%S') if service['last_check'] else 'Never'}")
-                    print(f"     错误计数: {service['error_count']}")
-                    
-                    if service_name == "backend" and hasattr(service, 'agent_count'):
-                        print(f"     AI代理数量: {service['agent_count']}")
-                    
-                    print()
+                # 检查所有服务，本轮共用一个时间戳
+                now = datetime.now()
+                self._refresh_services(now, probe)
                 
-                # 快速操作
-                print(f"🔧 快速操作:")
-                print(f"  [1] 查看日志")
-                print(f"  [2] 重启服务") 
-                print(f"  [3] 停止服务")
-                print(f"  [4] 刷新状态")
-                print(f"  [0] 退出")
+                self._render_monitor(now)
                 
-                print(f"\n{'=' * 60}")
-                
-                # 等待10秒后刷新
-                time.sleep(10)
+                # 最多等待10秒后刷新，有按键时立即处理
+                key = self._wait_for_key(10)
+                if key is not None:
+                    if not self._handle_monitor_key(key):
+                        print(f"\n退出监控...")
+                        break
+                    # 操作可能输出了其他内容，下次刷新时完整重绘
+                    self._last_sig = None
                 
         except KeyboardInterrupt:
             print(f"\n退出监控...")
+        finally:
+            if term_state is not None:
+                termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, term_state)
+            self._close_async_probe(probe)
     
     def ask_user_choice(self) -> str:
         """询问用户选择"""
-        print(f"\n{Color.BOLD}{Color.CYAN}请选择操作:{Color.RESET}")
-        print(f"{Color.GREEN}1. 完整安装部署 (推荐){Color.RESET} - 安装Docker + 环境检查 + 启动服务")
-        print(f"{Color.BLUE}2. 快速启动{Color.RESET} - 一键启动，跳过详细检查") 
-        print(f"{Color.YELLOW}3. 环境检查{Color.RESET} - 仅检查环境，不启动服务")
-        print(f"{Color.PURPLE}4. 服务监控{Color.RESET} - 实时监控服务状态")
-        print(f"{Color.CYAN}5. 快速检查{Color.RESET} - 检查当前服务状态")
-        print(f"{Color.MAGENTA}6. 环境检测{Color.RESET} - 检测网络和IP信息")
-        print(f"{Color.RED}0. 退出{Color.RESET}")
+        self._write(self._menu_text)
         
         while True:
             try:
@@ -1020,6 +1636,8 @@ class SuperLauncher:
     
     def show_environment_info(self):
         """显示环境信息"""
+        import platform
+        
         print(f"\n{Color.BOLD}{Color.PURPLE}🌐 环境检测结果{Color.RESET}")
         print("=" * 40)
         
@@ -1128,35 +1746,39 @@ class SuperLauncher:
         return True
 
 
+# 命令行参数 -> 启动器方法名
+DISPATCH = {
+    "--auto": "run_auto",
+    "--quick": "run_quick_start",
+    "--check": "run_full_installation",
+    "--monitor": "run_interactive_monitoring",
+    "--quick-check": "run_quick_check",
+    "--install": "run_full_installation",
+    "--env": "show_environment_info"
+}
+
+USAGE = """用法: python3 super_launcher.py [--auto|--quick|--check|--monitor|--quick-check|--install|--env] [--exhaustive]
+  --auto: 完整自动安装部署
+  --quick: 快速启动服务
+  --check: 环境检查和修复
+  --monitor: 服务监控
+  --quick-check: 快速检查服务状态
+  --install: 完整安装流程
+  --env: 环境检测
+  --exhaustive: 安装检查时额外测试Docker镜像拉取"""
+
+
 def main():
     """主函数"""
-    launcher = SuperLauncher()
+    launcher = SuperLauncher(exhaustive="--exhaustive" in sys.argv)
     
     # 检查命令行参数
     if len(sys.argv) > 1:
-        if sys.argv[1] == "--auto":
-            launcher.run_auto()
-        elif sys.argv[1] == "--quick":
-            launcher.run_quick_start()
-        elif sys.argv[1] == "--check":
-            launcher.run_full_installation()
-        elif sys.argv[1] == "--monitor":
-            launcher.run_interactive_monitoring()
-        elif sys.argv[1] == "--quick-check":
-            launcher.run_quick_check()
-        elif sys.argv[1] == "--install":
-            launcher.run_full_installation()
-        elif sys.argv[1] == "--env":
-            launcher.show_environment_info()
+        method = DISPATCH.get(sys.argv[1])
+        if method:
+            getattr(launcher, method)()
         else:
-            print("用法: python3 super_launcher.py [--auto|--quick|--check|--monitor|--quick-check|--install|--env]")
-            print("  --auto: 完整自动安装部署")
-            print("  --quick: 快速启动服务")
-            print("  --check: 环境检查和修复")
-            print("  --monitor: 服务监控")
-            print("  --quick-check: 快速检查服务状态")
-            print("  --install: 完整安装流程")
-            print("  --env: 环境检测")
+            print(USAGE)
     else:
         launcher.run_interactive()
 